@@ -15,13 +15,8 @@ from hyperglass.constants import __version__
 from hyperglass.exceptions import HyperglassError
 
 # Local
-from .events import startup_handler, shutdown_handler
-from .routes import (
-    info, query, device, devices, queries,
-    speedtest_download, speedtest_upload, speedtest_file,
-    iperf3_server, network_ping, network_traceroute, bandwidth_stats,
-    als_status
-)
+from .events import lifespan
+from .routes import ALS_HANDLERS, info, query, device, devices, queries
 from .middleware import COMPRESSION_CONFIG, create_cors_config
 from .error_handlers import app_handler, http_handler, default_handler, validation_handler
 
@@ -47,14 +42,7 @@ HANDLERS = [
     queries,
     info,
     query,
-    speedtest_download,
-    speedtest_upload,
-    speedtest_file,
-    iperf3_server,
-    network_ping,
-    network_traceroute,
-    bandwidth_stats,
-    als_status,
+    *ALS_HANDLERS,
 ]
 
 if not STATE.settings.disable_ui:
@@ -77,8 +65,7 @@ app = Litestar(
         ValidationException: validation_handler,
         Exception: default_handler,
     },
-    on_startup=[startup_handler],
-    on_shutdown=[shutdown_handler],
+    lifespan=[lifespan],
     debug=STATE.settings.debug,
     cors_config=create_cors_config(state=STATE),
     compression_config=COMPRESSION_CONFIG,
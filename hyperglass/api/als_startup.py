@@ -1,14 +1,26 @@
 """ALS Features Startup and Initialization."""
 
 # Standard Library
-import asyncio
-from typing import Optional
+import copy
+import time
+from typing import Any, Dict, List, Tuple, Optional
 
 # Project
 from hyperglass.log import log
 from hyperglass.state import use_state
 from hyperglass.util.als_config_validator import validate_als_config, check_system_requirements
 
+# Local
+from .bandwidth import bandwidth_monitor
+from .speedtest import reset_speedtest_config
+from .network_tools import iperf3_manager
+
+# Seconds a built status payload is reused before configuration is re-read.
+STATUS_CACHE_TTL = 5.0
+
+# (built_at, (monitoring, iperf3_ports), status)
+_status_cache: Optional[Tuple[float, Tuple[bool, Tuple[int, ...]], Dict[str, Any]]] = None
+
 
 async def initialize_als_features() -> bool:
     """
@@ -29,8 +41,7 @@ async def initialize_als_features() -> bool:
         log.info("Initializing ALS features...")
         
         # Validate configuration
-        config_dict = state.params.model_dump()
-        is_valid, errors = validate_als_config(config_dict)
+        is_valid, errors = validate_als_config(als_config)
         
         if not is_valid:
             log.error("ALS configuration validation failed:")
@@ -45,9 +56,15 @@ async def initialize_als_features() -> bool:
             for tool in missing_tools:
                 log.warning(f"  - {tool}")
         
+        # Re-read the speed test configuration
+        reset_speedtest_config()
+        
         # Initialize bandwidth monitoring if enabled and auto_start is True
         if als_config.bandwidth.enabled and als_config.bandwidth.auto_start:
-            await start_bandwidth_monitoring()
+            await start_bandwidth_monitoring(
+                interval=als_config.bandwidth.update_interval,
+                excluded_interfaces=als_config.bandwidth.excluded_interfaces,
+            )
         
         # Log enabled features
         enabled_features = []
@@ -66,18 +83,25 @@ async def initialize_als_features() -> bool:
         return False
 
 
-async def start_bandwidth_monitoring() -> bool:
+async def start_bandwidth_monitoring(
+    interval: Optional[float] = None,
+    excluded_interfaces: Optional[List[str]] = None,
+) -> bool:
     """
     Start bandwidth monitoring if configured to auto-start.
     
+    Args:
+        interval: Collection interval in seconds, defaults to the monitor's current interval
+        excluded_interfaces: Interface name prefixes to skip, defaults to the monitor's current list
+        
     Returns:
         True if started successfully, False otherwise
     """
     try:
-        # Import here to avoid circular imports
-        from .bandwidth import bandwidth_monitor
-        
-        await bandwidth_monitor.start_monitoring()
+        await bandwidth_monitor.start_monitoring(
+            interval=interval, excluded_interfaces=excluded_interfaces
+        )
+        invalidate_als_status()
         log.info("Bandwidth monitoring started automatically")
         return True
         
@@ -100,7 +124,6 @@ async def shutdown_als_features() -> None:
         # Stop bandwidth monitoring
         if als_config.bandwidth.enabled:
             try:
-                from .bandwidth import bandwidth_monitor
                 await bandwidth_monitor.stop_monitoring()
                 log.info("Bandwidth monitoring stopped")
             except Exception as e:
@@ -109,80 +132,46 @@ async def shutdown_als_features() -> None:
         # Stop any running iperf3 servers
         if als_config.network_tools.enabled and als_config.network_tools.iperf3_enabled:
             try:
-                from .network_tools import iperf3_manager
                 # Stop all running servers
-                for port in list(iperf3_manager.processes.keys()):
-                    await iperf3_manager.stop_server(port)
+                await iperf3_manager.stop_all()
                 log.info("All iperf3 servers stopped")
             except Exception as e:
                 log.error(f"Error stopping iperf3 servers: {e}")
         
+        invalidate_als_status()
         log.info("ALS features shutdown complete")
         
     except Exception as e:
         log.error(f"Error during ALS features shutdown: {e}")
 
 
+def invalidate_als_status() -> None:
+    """Discard the cached ALS status so the next call rebuilds it."""
+    global _status_cache
+    _status_cache = None
+
+
 def get_als_status() -> dict:
     """
     Get current status of ALS features.
     
+    The result is cached for `STATUS_CACHE_TTL` seconds, and rebuilt early if the
+    bandwidth monitor starts/stops or the set of running iperf3 servers changes. Each
+    call returns its own copy, so callers may modify it.
+    
     Returns:
         Dictionary with status information
     """
+    global _status_cache
+    
+    runtime = (bandwidth_monitor.monitoring, tuple(iperf3_manager.processes))
+    if _status_cache is not None:
+        built_at, cached_runtime, cached_status = _status_cache
+        if cached_runtime == runtime and time.monotonic() - built_at < STATUS_CACHE_TTL:
+            return copy.deepcopy(cached_status)
+    
     try:
-        state = use_state()
-        als_config = getattr(state.params, 'als_features', None)
-        
-        if not als_config:
-            return {
-                "enabled": False,
-                "features": {},
-                "status": "not_configured"
-            }
-        
-        status = {
-            "enabled": als_config.enabled,
-            "features": {
-                "speedtest": {
-                    "enabled": als_config.speedtest.enabled,
-                    "file_sizes": als_config.speedtest.file_sizes,
-                    "upload_enabled": als_config.speedtest.upload_enabled,
-                    "download_enabled": als_config.speedtest.download_enabled,
-                },
-                "network_tools": {
-                    "enabled": als_config.network_tools.enabled,
-                    "ping_enabled": als_config.network_tools.ping_enabled,
-                    "traceroute_enabled": als_config.network_tools.traceroute_enabled,
-                    "iperf3_enabled": als_config.network_tools.iperf3_enabled,
-                },
-                "bandwidth": {
-                    "enabled": als_config.bandwidth.enabled,
-                    "auto_start": als_config.bandwidth.auto_start,
-                    "update_interval": als_config.bandwidth.update_interval,
-                },
-            },
-            "status": "configured"
-        }
-        
-        # Add runtime status
-        if als_config.enabled:
-            # Check if bandwidth monitoring is running
-            try:
-                from .bandwidth import bandwidth_monitor
-                status["features"]["bandwidth"]["running"] = bandwidth_monitor.monitoring
-            except:
-                status["features"]["bandwidth"]["running"] = False
-            
-            # Check running iperf3 servers
-            try:
-                from .network_tools import iperf3_manager
-                status["features"]["network_tools"]["iperf3_servers"] = list(iperf3_manager.processes.keys())
-            except:
-                status["features"]["network_tools"]["iperf3_servers"] = []
-        
-        return status
-        
+        status = _build_als_status(*runtime)
     except Exception as e:
         log.error(f"Error getting ALS status: {e}")
         return {
@@ -191,6 +180,53 @@ def get_als_status() -> dict:
             "status": "error",
             "error": str(e)
         }
+    
+    _status_cache = (time.monotonic(), runtime, status)
+    return copy.deepcopy(status)
+
+
+def _build_als_status(monitoring: bool, iperf3_ports: Tuple[int, ...]) -> dict:
+    """Build the ALS status payload from configuration and runtime state."""
+    state = use_state()
+    als_config = getattr(state.params, 'als_features', None)
+    
+    if not als_config:
+        return {
+            "enabled": False,
+            "features": {},
+            "status": "not_configured"
+        }
+    
+    status = {
+        "enabled": als_config.enabled,
+        "features": {
+            "speedtest": {
+                "enabled": als_config.speedtest.enabled,
+                "file_sizes": als_config.speedtest.file_sizes,
+                "upload_enabled": als_config.speedtest.upload_enabled,
+                "download_enabled": als_config.speedtest.download_enabled,
+            },
+            "network_tools": {
+                "enabled": als_config.network_tools.enabled,
+                "ping_enabled": als_config.network_tools.ping_enabled,
+                "traceroute_enabled": als_config.network_tools.traceroute_enabled,
+                "iperf3_enabled": als_config.network_tools.iperf3_enabled,
+            },
+            "bandwidth": {
+                "enabled": als_config.bandwidth.enabled,
+                "auto_start": als_config.bandwidth.auto_start,
+                "update_interval": als_config.bandwidth.update_interval,
+            },
+        },
+        "status": "configured"
+    }
+    
+    # Add runtime status
+    if als_config.enabled:
+        status["features"]["bandwidth"]["running"] = monitoring
+        status["features"]["network_tools"]["iperf3_servers"] = list(iperf3_ports)
+    
+    return status
 
 
 # Event handlers for application lifecycle
@@ -1,13 +1,17 @@
 """Bandwidth monitoring API endpoints implementation."""
 
 # Standard Library
+import sys
+import math
 import time
 import asyncio
 import psutil
-from typing import Dict, List, Any, Optional
-from collections import defaultdict, deque
+from array import array
+from typing import IO, Any, Set, Dict, Tuple, Iterator, Optional, Sequence, NamedTuple
+from collections import defaultdict
 
 # Third Party
+import msgspec
 from litestar import Request, Response
 from litestar.exceptions import HTTPException
 
@@ -15,21 +19,159 @@ from litestar.exceptions import HTTPException
 from hyperglass.log import log
 from hyperglass.state import use_state
 
+# Encode JSON payloads straight to bytes, bypassing Litestar's per-response
+# serializer lookup.
+_JSON_ENCODER = msgspec.json.Encoder()
+
+
+# Interface name prefixes skipped by default (loopback and virtual interfaces).
+_EXCLUDED = ("lo", "docker", "br-", "veth")
+
+# Seconds between re-discovering which interfaces to track.
+_DISCOVERY_INTERVAL = 60
+
+# Seconds interface addresses/link details are cached for.
+_INTERFACE_INFO_TTL = 10.0
+
+# Seconds of sample history included in current statistics.
+_STATS_HISTORY_SECONDS = 30
+
+# On Linux, counters are read straight from procfs instead of through psutil.
+_PROC_NET_DEV = "/proc/net/dev"
+_USE_PROCFS = sys.platform.startswith("linux")
+
+_Counters = Tuple[str, int, int, int, int]
+
+
+class _Sample(NamedTuple):
+    """Single interface counter sample with derived per-second rates."""
+
+    timestamp: float
+    bytes_sent: int
+    bytes_recv: int
+    packets_sent: int
+    packets_recv: int
+    send_rate: float = 0
+    recv_rate: float = 0
+    send_packets_rate: float = 0
+    recv_packets_rate: float = 0
+
+
+_FIELDS = len(_Sample._fields)
+
+
+class _Ring:
+    """Fixed-capacity sample history backed by a single preallocated float array."""
+
+    __slots__ = ("capacity", "count", "_pos", "_data", "_last_monotonic")
+
+    def __init__(self, capacity: int = 60):
+        self.capacity = capacity
+        self.count = 0
+        self._pos = 0
+        self._data = array("d", bytes(8 * _FIELDS * capacity))
+        self._last_monotonic = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(
+        self,
+        timestamp: float,
+        monotonic: float,
+        bytes_sent: int,
+        bytes_recv: int,
+        packets_sent: int,
+        packets_recv: int,
+    ) -> None:
+        """Write a counter sample, deriving rates from the previous sample in place.
+
+        `timestamp` is the wall-clock time reported to clients; rates are computed
+        from `monotonic` so clock adjustments can't skew or invert them.
+        """
+        data = self._data
+        offset = self._pos * _FIELDS
+
+        if self.count:
+            last = ((self._pos - 1) % self.capacity) * _FIELDS
+            time_diff = monotonic - self._last_monotonic
+        else:
+            time_diff = 0
+        self._last_monotonic = monotonic
+
+        data[offset] = timestamp
+        data[offset + 1] = bytes_sent
+        data[offset + 2] = bytes_recv
+        data[offset + 3] = packets_sent
+        data[offset + 4] = packets_recv
+
+        # Calculate rates if we have previous data
+        if time_diff > 0:
+            data[offset + 5] = (bytes_sent - data[last + 1]) / time_diff
+            data[offset + 6] = (bytes_recv - data[last + 2]) / time_diff
+            data[offset + 7] = (packets_sent - data[last + 3]) / time_diff
+            data[offset + 8] = (packets_recv - data[last + 4]) / time_diff
+        else:
+            data[offset + 5 : offset + _FIELDS] = array("d", bytes(8 * 4))
+
+        self._pos = (self._pos + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def _sample(self, index: int) -> _Sample:
+        data = self._data
+        offset = index * _FIELDS
+        return _Sample(
+            data[offset],
+            int(data[offset + 1]),
+            int(data[offset + 2]),
+            int(data[offset + 3]),
+            int(data[offset + 4]),
+            *data[offset + 5 : offset + _FIELDS],
+        )
+
+    def latest(self) -> _Sample:
+        """Get the most recently written sample."""
+        return self._sample((self._pos - 1) % self.capacity)
+
+    def tail(self, count: int) -> Iterator[_Sample]:
+        """Iterate over up to `count` of the most recent samples, oldest first."""
+        count = min(count, self.count)
+        start = self._pos - count
+        for i in range(count):
+            yield self._sample((start + i) % self.capacity)
+
 
 class BandwidthMonitor:
     """Bandwidth monitoring class."""
     
-    def __init__(self):
-        self.interface_stats: Dict[str, deque] = defaultdict(lambda: deque(maxlen=60))
-        self.last_stats: Dict[str, Dict] = {}
+    def __init__(self, interval: float = 1, excluded_interfaces: Sequence[str] = _EXCLUDED):
+        self.interval = interval
+        # Kept as a tuple so each check is a single C-level str.startswith call.
+        self.excluded_interfaces: Tuple[str, ...] = tuple(excluded_interfaces)
+        self.interface_stats: Dict[str, _Ring] = defaultdict(_Ring)
         self.monitoring = False
         self.monitor_task: Optional[asyncio.Task] = None
+        self._tracked_ifaces: Set[str] = set()
+        self._discovered_at: float = 0
+        self._proc_net_dev: Optional[IO[bytes]] = None
+        self._interface_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
     
-    async def start_monitoring(self):
-        """Start bandwidth monitoring."""
+    async def start_monitoring(
+        self,
+        interval: Optional[float] = None,
+        excluded_interfaces: Optional[Sequence[str]] = None,
+    ):
+        """Start bandwidth monitoring, optionally overriding the interval or exclusions."""
         if self.monitoring:
             return
         
+        if interval is not None:
+            self.interval = interval
+        if excluded_interfaces is not None:
+            self.excluded_interfaces = tuple(excluded_interfaces)
+            self._interface_info_cache = None
+        self._discover_interfaces()
         self.monitoring = True
         self.monitor_task = asyncio.create_task(self._monitor_loop())
         log.info("Started bandwidth monitoring")
@@ -46,67 +188,81 @@ class BandwidthMonitor:
                 await self.monitor_task
             except asyncio.CancelledError:
                 pass
+        if self._proc_net_dev is not None:
+            self._proc_net_dev.close()
+            self._proc_net_dev = None
         log.info("Stopped bandwidth monitoring")
     
     async def _monitor_loop(self):
         """Main monitoring loop."""
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time()
         try:
             while self.monitoring:
                 await self._collect_stats()
-                await asyncio.sleep(1)  # Collect stats every second
+                # Schedule against a fixed deadline so collection time doesn't
+                # drift the cadence; if we've fallen behind, skip missed ticks.
+                next_deadline += self.interval
+                delay = next_deadline - loop.time()
+                if delay < 0:
+                    next_deadline = loop.time()
+                else:
+                    await asyncio.sleep(delay)
         except asyncio.CancelledError:
             pass
         except Exception as e:
             log.error(f"Bandwidth monitoring error: {e}")
     
+    def _discover_interfaces(self) -> None:
+        """Refresh the set of non-excluded interfaces to sample."""
+        excluded = self.excluded_interfaces
+        self._tracked_ifaces = {
+            interface
+            for interface in psutil.net_if_stats()
+            if not interface.startswith(excluded)
+        }
+        self._discovered_at = time.monotonic()
+    
+    def _read_proc_net_dev(self) -> Iterator[_Counters]:
+        """Read counters for tracked interfaces from /proc/net/dev."""
+        if self._proc_net_dev is None:
+            self._proc_net_dev = open(_PROC_NET_DEV, "rb")
+        self._proc_net_dev.seek(0)
+        tracked = self._tracked_ifaces
+        
+        # The first two lines are column headers.
+        for line in self._proc_net_dev.read().splitlines()[2:]:
+            name, _, fields = line.partition(b":")
+            interface = name.strip().decode()
+            if interface not in tracked:
+                continue
+            
+            # Receive columns come first, followed by transmit columns.
+            values = fields.split()
+            yield interface, int(values[8]), int(values[0]), int(values[9]), int(values[1])
+    
+    def _read_psutil(self) -> Iterator[_Counters]:
+        """Read counters for tracked interfaces from psutil."""
+        tracked = self._tracked_ifaces
+        for interface, stats in psutil.net_io_counters(pernic=True, nowrap=True).items():
+            if interface in tracked:
+                yield interface, *stats[:4]
+    
     async def _collect_stats(self):
         """Collect network interface statistics."""
         try:
+            if time.monotonic() - self._discovered_at >= _DISCOVERY_INTERVAL:
+                self._discover_interfaces()
+            
             current_time = time.time()
-            net_io = psutil.net_io_counters(pernic=True)
+            monotonic = asyncio.get_running_loop().time()
+            counters = self._read_proc_net_dev() if _USE_PROCFS else self._read_psutil()
+            interface_stats = self.interface_stats
             
-            for interface, stats in net_io.items():
-                # Skip loopback and virtual interfaces
-                if interface.startswith(('lo', 'docker', 'br-', 'veth')):
-                    continue
-                
-                current_stats = {
-                    'timestamp': current_time,
-                    'bytes_sent': stats.bytes_sent,
-                    'bytes_recv': stats.bytes_recv,
-                    'packets_sent': stats.packets_sent,
-                    'packets_recv': stats.packets_recv,
-                }
-                
-                # Calculate rates if we have previous data
-                if interface in self.last_stats:
-                    last = self.last_stats[interface]
-                    time_diff = current_time - last['timestamp']
-                    
-                    if time_diff > 0:
-                        current_stats.update({
-                            'send_rate': (stats.bytes_sent - last['bytes_sent']) / time_diff,
-                            'recv_rate': (stats.bytes_recv - last['bytes_recv']) / time_diff,
-                            'send_packets_rate': (stats.packets_sent - last['packets_sent']) / time_diff,
-                            'recv_packets_rate': (stats.packets_recv - last['packets_recv']) / time_diff,
-                        })
-                    else:
-                        current_stats.update({
-                            'send_rate': 0,
-                            'recv_rate': 0,
-                            'send_packets_rate': 0,
-                            'recv_packets_rate': 0,
-                        })
-                else:
-                    current_stats.update({
-                        'send_rate': 0,
-                        'recv_rate': 0,
-                        'send_packets_rate': 0,
-                        'recv_packets_rate': 0,
-                    })
-                
-                self.interface_stats[interface].append(current_stats)
-                self.last_stats[interface] = current_stats
+            for interface, bytes_sent, bytes_recv, packets_sent, packets_recv in counters:
+                interface_stats[interface].append(
+                    current_time, monotonic, bytes_sent, bytes_recv, packets_sent, packets_recv
+                )
                 
         except Exception as e:
             log.error(f"Error collecting network stats: {e}")
@@ -114,40 +270,47 @@ class BandwidthMonitor:
     def get_current_stats(self) -> Dict[str, Any]:
         """Get current bandwidth statistics."""
         result = {}
+        # Samples are taken every `interval` seconds, which is configurable.
+        history_samples = max(1, math.ceil(_STATS_HISTORY_SECONDS / self.interval))
         
-        for interface, stats_deque in self.interface_stats.items():
-            if not stats_deque:
+        for interface, ring in self.interface_stats.items():
+            if not ring:
                 continue
             
-            latest = stats_deque[-1]
-            history = list(stats_deque)
+            latest = ring.latest()
             
             result[interface] = {
                 'current': {
-                    'send_rate': latest.get('send_rate', 0),
-                    'recv_rate': latest.get('recv_rate', 0),
-                    'send_packets_rate': latest.get('send_packets_rate', 0),
-                    'recv_packets_rate': latest.get('recv_packets_rate', 0),
-                    'total_sent': latest.get('bytes_sent', 0),
-                    'total_recv': latest.get('bytes_recv', 0),
-                    'timestamp': latest.get('timestamp', 0),
+                    'send_rate': latest.send_rate,
+                    'recv_rate': latest.recv_rate,
+                    'send_packets_rate': latest.send_packets_rate,
+                    'recv_packets_rate': latest.recv_packets_rate,
+                    'total_sent': latest.bytes_sent,
+                    'total_recv': latest.bytes_recv,
+                    'timestamp': latest.timestamp,
                 },
-                'history': history[-30:],  # Last 30 seconds
+                'history': [sample._asdict() for sample in ring.tail(history_samples)],
             }
         
         return result
     
     def get_interface_info(self) -> Dict[str, Any]:
-        """Get network interface information."""
+        """Get network interface information, cached for a few seconds."""
+        if self._interface_info_cache is not None:
+            cached_at, interfaces = self._interface_info_cache
+            if time.monotonic() - cached_at < _INTERFACE_INFO_TTL:
+                return interfaces
+        
         interfaces = {}
         
         try:
             net_if_addrs = psutil.net_if_addrs()
             net_if_stats = psutil.net_if_stats()
+            excluded = self.excluded_interfaces
             
             for interface, addrs in net_if_addrs.items():
                 # Skip loopback and virtual interfaces
-                if interface.startswith(('lo', 'docker', 'br-', 'veth')):
+                if interface.startswith(excluded):
                     continue
                 
                 interface_info = {
@@ -180,7 +343,9 @@ class BandwidthMonitor:
                 
         except Exception as e:
             log.error(f"Error getting interface info: {e}")
+            return interfaces
         
+        self._interface_info_cache = (time.monotonic(), interfaces)
         return interfaces
 
 
@@ -195,25 +360,21 @@ async def handle_bandwidth_stats(request: Request) -> Response:
     
     if action == "start":
         await bandwidth_monitor.start_monitoring()
-        return Response(
-            content={"status": "started", "message": "Bandwidth monitoring started"},
-            media_type="application/json"
-        )
+        result = {"status": "started", "message": "Bandwidth monitoring started"}
+        return Response(content=_JSON_ENCODER.encode(result), media_type="application/json")
     
     elif action == "stop":
         await bandwidth_monitor.stop_monitoring()
-        return Response(
-            content={"status": "stopped", "message": "Bandwidth monitoring stopped"},
-            media_type="application/json"
-        )
+        result = {"status": "stopped", "message": "Bandwidth monitoring stopped"}
+        return Response(content=_JSON_ENCODER.encode(result), media_type="application/json")
     
     elif action == "get":
         stats = bandwidth_monitor.get_current_stats()
-        return Response(content=stats, media_type="application/json")
+        return Response(content=_JSON_ENCODER.encode(stats), media_type="application/json")
     
     elif action == "interfaces":
         interfaces = bandwidth_monitor.get_interface_info()
-        return Response(content=interfaces, media_type="application/json")
+        return Response(content=_JSON_ENCODER.encode(interfaces), media_type="application/json")
     
     else:
         raise HTTPException(status_code=400, detail="Invalid action. Use 'start', 'stop', 'get', or 'interfaces'")
@@ -16,13 +16,14 @@ __all__ = (
     "http_handler",
     "app_handler",
     "validation_handler",
+    "parameter_validation_handler",
 )
 
 
-def get_validation_exception_detail(exc: ValidationException) -> Response:
+def _validation_exception_data(exc: ValidationException, status_code: int) -> dict[str, t.Any]:
     data: dict[str, t.Any] = {
         "level": "error",
-        "status_code": 422,
+        "status_code": status_code,
         "keywords": [],
         "output": repr(exc),
     }
@@ -39,7 +40,11 @@ def get_validation_exception_detail(exc: ValidationException) -> Response:
         data["output"] = "\n".join(str(v) for v in exc.extra)
         data["keywords"] = []
 
-    return Response(data)
+    return data
+
+
+def get_validation_exception_detail(exc: ValidationException) -> Response:
+    return Response(_validation_exception_data(exc, 422))
 
 
 def default_handler(request: Request, exc: BaseException) -> Response:
@@ -76,3 +81,9 @@ def validation_handler(request: Request, exc: ValidationException) -> Response:
     """Handle Pydantic validation errors raised by FastAPI."""
     log.bind(method=request.method, path=request.url.path, detail=exc).critical("Validation Error")
     return get_validation_exception_detail(exc)
+
+
+def parameter_validation_handler(request: Request, exc: ValidationException) -> Response:
+    """Handle invalid query parameters with a client error status."""
+    log.bind(method=request.method, path=request.url.path, detail=exc).critical("Validation Error")
+    return Response(_validation_exception_data(exc, 400), status_code=400)
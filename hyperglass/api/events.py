@@ -2,6 +2,7 @@
 
 # Standard Library
 import typing as t
+from contextlib import asynccontextmanager
 
 # Third Party
 from litestar import Litestar
@@ -12,7 +13,7 @@ from hyperglass.state import use_state
 # Local
 from .als_startup import on_startup, on_shutdown
 
-__all__ = ("check_redis", "startup_handler", "shutdown_handler")
+__all__ = ("check_redis", "lifespan")
 
 
 async def check_redis(_: Litestar) -> t.NoReturn:
@@ -21,12 +22,12 @@ async def check_redis(_: Litestar) -> t.NoReturn:
     cache.check()
 
 
-async def startup_handler(_: Litestar) -> None:
-    """Application startup handler."""
-    await check_redis(_)
+@asynccontextmanager
+async def lifespan(app: Litestar) -> t.AsyncGenerator[None, None]:
+    """Application lifespan: run startup tasks, then shutdown tasks on exit."""
+    await check_redis(app)
     await on_startup()
-
-
-async def shutdown_handler(_: Litestar) -> None:
-    """Application shutdown handler."""
-    await on_shutdown()
+    try:
+        yield
+    finally:
+        await on_shutdown()
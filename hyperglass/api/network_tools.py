@@ -1,34 +1,116 @@
 """Network tools API endpoints implementation."""
 
 # Standard Library
+import os
+import re
+import signal
 import asyncio
-import subprocess
-import json
 import time
 import socket
-import random
-from typing import Dict, Any, Optional
+import ipaddress
+from typing import Any, Dict, List, Tuple, Optional, Annotated, AsyncIterator
 
 # Third Party
-from litestar import Request, Response
+import msgspec
+from litestar import Response
+from litestar.params import Parameter
+from litestar.response import Stream
 from litestar.exceptions import HTTPException
 
 # Project
 from hyperglass.log import log
 from hyperglass.state import use_state
 
+# Encode JSON payloads straight to bytes, bypassing Litestar's per-response
+# serializer lookup.
+_JSON_ENCODER = msgspec.json.Encoder()
+
+# RFC 1123 hostname: dot-separated labels of up to 63 alphanumerics/hyphens that
+# don't start or end with a hyphen, 253 characters total.
+_HOSTNAME_RE = re.compile(
+    r"^(?=.{1,253}$)[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
+    r"(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)*$"
+)
+
+
+def _valid_target(target: str) -> bool:
+    """Check that a ping/traceroute target is an IP address or hostname."""
+    try:
+        ipaddress.ip_address(target)
+        return True
+    except ValueError:
+        pass
+    return _HOSTNAME_RE.match(target) is not None
+
+
+async def _stream_output(
+    process: asyncio.subprocess.Process, timeout: float
+) -> AsyncIterator[bytes]:
+    """Yield a command's output line by line, killing it if it outlives `timeout`."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while line := await asyncio.wait_for(process.stdout.readline(), deadline - loop.time()):
+            yield line
+        await asyncio.wait_for(process.wait(), deadline - loop.time())
+    except asyncio.TimeoutError:
+        yield b"\nCommand timed out\n"
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+async def _stream_command(cmd: List[str], timeout: float) -> Stream:
+    """Run a command and stream its combined stdout/stderr as plain text."""
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        # Python-opened fds are non-inheritable (PEP 446), so there's nothing to
+        # close in the child; skip scanning the fd table on every spawn.
+        close_fds=False,
+    )
+    return Stream(_stream_output(process, timeout), media_type="text/plain")
+
+
+def _signal_group(process: asyncio.subprocess.Process, sig: int) -> None:
+    """Send a signal to a process's entire process group, if it still exists."""
+    if process.returncode is not None:
+        # Already reaped, so its process group ID may belong to another process.
+        return
+    try:
+        os.killpg(process.pid, sig)
+    except OSError:
+        pass
+
 
 class IPerf3Server:
     """IPerf3 server manager."""
     
     def __init__(self):
-        self.processes: Dict[int, subprocess.Popen] = {}
-        self.port_range = (30000, 31000)
+        self.processes: Dict[int, asyncio.subprocess.Process] = {}
+        # Overrides the configured iperf3 port range when set.
+        self.port_range: Optional[Tuple[int, int]] = None
+    
+    def get_port_range(self) -> Tuple[int, int]:
+        """Get the inclusive range of ports iperf3 servers may use."""
+        if self.port_range is not None:
+            return self.port_range
+        config = get_network_tools_config()
+        return config["iperf3_port_start"], config["iperf3_port_end"]
     
     def get_available_port(self) -> int:
         """Get an available port for iperf3 server."""
-        for _ in range(100):  # Try 100 times
-            port = random.randint(*self.port_range)
+        # Servers started with `-1` exit after a single test; release their ports.
+        for port in [p for p, proc in self.processes.items() if proc.returncode is not None]:
+            del self.processes[port]
+        
+        start, end = self.get_port_range()
+        for port in range(start, end + 1):
+            # Skip ports already held by one of our servers without a bind attempt.
+            if port in self.processes:
+                continue
             try:
                 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                     s.bind(('', port))
@@ -54,7 +136,11 @@ class IPerf3Server:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                close_fds=False,
+                # Run in its own process group so stop_server can signal the
+                # server and anything it spawns in one call.
+                start_new_session=True,
             )
             
             self.processes[port] = process
@@ -79,66 +165,71 @@ class IPerf3Server:
         """Stop an iperf3 server instance."""
         if port in self.processes:
             process = self.processes[port]
-            process.terminate()
+            _signal_group(process, signal.SIGTERM)
             try:
                 await asyncio.wait_for(process.wait(), timeout=5.0)
             except asyncio.TimeoutError:
-                process.kill()
-            del self.processes[port]
+                _signal_group(process, signal.SIGKILL)
+                # Reap the process so it doesn't linger as a zombie.
+                await process.wait()
+            # The entry may already be gone if the server exited while being stopped.
+            self.processes.pop(port, None)
             log.info(f"Stopped iperf3 server on port {port}")
             return True
         return False
+    
+    async def stop_all(self) -> None:
+        """Stop all running iperf3 server instances concurrently."""
+        ports = list(self.processes.keys())
+        
+        # Each stop_server call signals its process before its first await, so
+        # every server is terminated up front and the exit waits overlap.
+        results = await asyncio.gather(
+            *(self.stop_server(port) for port in ports), return_exceptions=True
+        )
+        for port, result in zip(ports, results):
+            if isinstance(result, Exception):
+                log.error(f"Error stopping iperf3 server on port {port}: {result}")
 
 
 # Global iperf3 server manager
 iperf3_manager = IPerf3Server()
 
 
-async def handle_iperf3_server(request: Request) -> Response:
+async def handle_iperf3_server(
+    action: str = "start", duration: int = 300, port: Optional[int] = None
+) -> Response:
     """Handle iperf3 server endpoint."""
     
-    action = request.query_params.get("action", "start")
-    
     if action == "start":
-        duration = int(request.query_params.get("duration", "300"))
         result = await iperf3_manager.start_server(duration)
-        return Response(content=result, media_type="application/json")
+        return Response(content=_JSON_ENCODER.encode(result), media_type="application/json")
     
     elif action == "stop":
-        port = request.query_params.get("port")
-        if not port:
+        if port is None:
             raise HTTPException(status_code=400, detail="Port parameter required for stop action")
         
-        try:
-            port_int = int(port)
-            success = await iperf3_manager.stop_server(port_int)
-            return Response(
-                content={"status": "stopped" if success else "not_found", "port": port_int},
-                media_type="application/json"
-            )
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid port number")
+        success = await iperf3_manager.stop_server(port)
+        result = {"status": "stopped" if success else "not_found", "port": port}
+        return Response(content=_JSON_ENCODER.encode(result), media_type="application/json")
     
     else:
         raise HTTPException(status_code=400, detail="Invalid action. Use 'start' or 'stop'")
 
 
-async def handle_network_ping(request: Request) -> Response:
-    """Handle network ping endpoint."""
-    
-    target = request.query_params.get("target")
-    count = int(request.query_params.get("count", "4"))
-    ipv6 = request.query_params.get("ipv6", "false").lower() == "true"
+async def handle_network_ping(
+    target: Annotated[str, Parameter(min_length=1)],
+    count: Annotated[int, Parameter(ge=1, le=20)] = 4,
+    ipv6: bool = False,
+    stream: bool = False,
+) -> Response:
+    """Handle network ping endpoint.
     
-    if not target:
-        raise HTTPException(status_code=400, detail="Target parameter required")
-    
-    # Validate count
-    if count < 1 or count > 20:
-        raise HTTPException(status_code=400, detail="Count must be between 1 and 20")
+    Query parameters are parsed and bounds-checked by Litestar from the signature.
+    """
     
     # Validate target (basic validation)
-    if not target.replace(".", "").replace(":", "").replace("-", "").isalnum():
+    if not _valid_target(target):
         raise HTTPException(status_code=400, detail="Invalid target format")
     
     try:
@@ -148,11 +239,16 @@ async def handle_network_ping(request: Request) -> Response:
         
         log.info(f"Running ping: {' '.join(cmd)}")
         
+        # Stream output as it's produced, if requested
+        if stream:
+            return await _stream_command(cmd, timeout=30.0)
+        
         # Execute ping command
         process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,
         )
         
         stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30.0)
@@ -167,7 +263,7 @@ async def handle_network_ping(request: Request) -> Response:
             "timestamp": int(time.time() * 1000)
         }
         
-        return Response(content=result, media_type="application/json")
+        return Response(content=_JSON_ENCODER.encode(result), media_type="application/json")
         
     except asyncio.TimeoutError:
         raise HTTPException(status_code=408, detail="Ping command timed out")
@@ -178,22 +274,19 @@ async def handle_network_ping(request: Request) -> Response:
         raise HTTPException(status_code=500, detail=f"Ping command failed: {e}")
 
 
-async def handle_traceroute(request: Request) -> Response:
-    """Handle network traceroute endpoint."""
+async def handle_traceroute(
+    target: Annotated[str, Parameter(min_length=1)],
+    max_hops: Annotated[int, Parameter(ge=1, le=64)] = 30,
+    ipv6: bool = False,
+    stream: bool = False,
+) -> Response:
+    """Handle network traceroute endpoint.
     
-    target = request.query_params.get("target")
-    max_hops = int(request.query_params.get("max_hops", "30"))
-    ipv6 = request.query_params.get("ipv6", "false").lower() == "true"
-    
-    if not target:
-        raise HTTPException(status_code=400, detail="Target parameter required")
-    
-    # Validate max_hops
-    if max_hops < 1 or max_hops > 64:
-        raise HTTPException(status_code=400, detail="Max hops must be between 1 and 64")
+    Query parameters are parsed and bounds-checked by Litestar from the signature.
+    """
     
     # Validate target (basic validation)
-    if not target.replace(".", "").replace(":", "").replace("-", "").isalnum():
+    if not _valid_target(target):
         raise HTTPException(status_code=400, detail="Invalid target format")
     
     try:
@@ -203,11 +296,16 @@ async def handle_traceroute(request: Request) -> Response:
         
         log.info(f"Running traceroute: {' '.join(cmd)}")
         
+        # Stream output as it's produced, if requested
+        if stream:
+            return await _stream_command(cmd, timeout=60.0)
+        
         # Execute traceroute command
         process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,
         )
         
         stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=60.0)
@@ -222,7 +320,7 @@ async def handle_traceroute(request: Request) -> Response:
             "timestamp": int(time.time() * 1000)
         }
         
-        return Response(content=result, media_type="application/json")
+        return Response(content=_JSON_ENCODER.encode(result), media_type="application/json")
         
     except asyncio.TimeoutError:
         raise HTTPException(status_code=408, detail="Traceroute command timed out")
@@ -242,14 +340,15 @@ def get_network_tools_config() -> dict:
         "ping_enabled": True,
         "traceroute_enabled": True,
         "iperf3_enabled": True,
-        "iperf3_port_range": [30000, 31000],
+        "iperf3_port_start": 30000,
+        "iperf3_port_end": 31000,
         "max_ping_count": 20,
         "max_traceroute_hops": 64,
     }
     
     # Override with user configuration if available
-    if hasattr(state.params, 'network_tools'):
-        user_config = state.params.network_tools
-        config.update(user_config)
+    als_features = getattr(state.params, 'als_features', None)
+    if als_features is not None:
+        config.update(als_features.network_tools.model_dump())
     
     return config
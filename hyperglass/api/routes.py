@@ -1,7 +1,6 @@
 """API Routes."""
 
 # Standard Library
-import json
 import time
 import typing as t
 from datetime import UTC, datetime
@@ -9,6 +8,7 @@ from datetime import UTC, datetime
 # Third Party
 from litestar import Request, Response, get, post
 from litestar.di import Provide
+from litestar.exceptions import ValidationException
 from litestar.background_tasks import BackgroundTask
 
 # Project
@@ -17,7 +17,6 @@ from hyperglass.state import HyperglassState
 from hyperglass.exceptions import HyperglassError
 from hyperglass.models.api import Query
 from hyperglass.models.data import OutputDataModel
-from hyperglass.util.typing import is_type
 from hyperglass.execution.main import execute
 from hyperglass.models.api.response import QueryResponse
 from hyperglass.models.config.params import Params, APIParams
@@ -26,7 +25,12 @@ from hyperglass.models.config.devices import Devices, APIDevice
 # Local
 from .state import get_state, get_params, get_devices
 from .tasks import send_webhook
+from .bandwidth import handle_bandwidth_stats
+from .speedtest import handle_speedtest_file, handle_speedtest_upload, handle_speedtest_download
+from .als_startup import get_als_status
 from .fake_output import fake_output
+from .network_tools import handle_traceroute, handle_network_ping, handle_iperf3_server
+from .error_handlers import parameter_validation_handler
 
 __all__ = (
     "device",
@@ -34,16 +38,13 @@ __all__ = (
     "queries",
     "info",
     "query",
-    "speedtest_download",
-    "speedtest_upload",
-    "speedtest_file",
-    "iperf3_server",
-    "network_ping",
-    "network_traceroute",
-    "bandwidth_stats",
     "als_status",
+    "ALS_HANDLERS",
 )
 
+# Concrete classes behind `OutputDataModel`, which may be a `Union`, for `isinstance` checks.
+_OUTPUT_MODEL_TYPES = t.get_args(OutputDataModel) or (OutputDataModel,)
+
 
 @get("/api/devices/{id:str}", dependencies={"devices": Provide(get_devices)})
 async def device(devices: Devices, id: str) -> APIDevice:
@@ -78,6 +79,13 @@ async def query(_state: HyperglassState, request: Request, data: Query) -> Query
     # Initialize cache
     cache = _state.redis
 
+    # Each `_state.params` access reads & unpickles the params from Redis, so read them
+    # once and keep the values used throughout the query local.
+    params = _state.params
+    cache_timeout = params.cache.timeout
+    err_message = params.messages.general
+    fake_output_enabled = params.fake_output
+
     # Use hashed `data` string as key for for k/v cache store so
     # each command output value is unique.
     cache_key = f"hyperglass.query.{data.digest()}"
@@ -86,29 +94,29 @@ async def query(_state: HyperglassState, request: Request, data: Query) -> Query
 
     _log.info("Starting query execution")
 
-    cache_response = cache.get_map(cache_key, "output")
-    json_output = False
+    # Read the cached output & timestamp, and reset the expiration time, in a single
+    # round trip. If nothing is cached, the expiration reset is a no-op.
+    cached_data = cache.get_all_map(cache_key, expire_in=cache_timeout)
+    response_body = cached_data.get("output")
     cached = False
     runtime = 65535
 
-    if cache_response:
+    if response_body:
         _log.bind(cache_key=cache_key).debug("Cache hit")
 
-        # If a cached response exists, reset the expiration time.
-        cache.expire(cache_key, expire_in=_state.params.cache.timeout)
-
         cached = True
         runtime = 0
-        timestamp = cache.get_map(cache_key, "timestamp")
+        timestamp = cached_data.get("timestamp")
+        json_output = isinstance(response_body, dict)
 
-    elif not cache_response:
+    else:
         _log.bind(cache_key=cache_key).debug("Cache miss")
 
         timestamp = data.timestamp
 
-        starttime = time.time()
+        starttime = time.monotonic_ns()
 
-        if _state.params.fake_output:
+        if fake_output_enabled:
             # Return fake, static data for development purposes, if enabled.
             output = await fake_output(
                 query_type=data.query_type,
@@ -118,43 +126,37 @@ async def query(_state: HyperglassState, request: Request, data: Query) -> Query
             # Pass request to execution module
             output = await execute(data)
 
-        endtime = time.time()
-        elapsedtime = round(endtime - starttime, 4)
+        endtime = time.monotonic_ns()
+        elapsedtime = round((endtime - starttime) / 1e9, 4)
         _log.debug("Runtime: {!s} seconds", elapsedtime)
 
         if output is None:
-            raise HyperglassError(message=_state.params.messages.general, alert="danger")
+            raise HyperglassError(message=err_message, alert="danger")
 
-        json_output = is_type(output, OutputDataModel)
+        json_output = isinstance(output, _OUTPUT_MODEL_TYPES)
 
         if json_output:
-            # Export structured output as JSON string to guarantee value
-            # is serializable, then convert it back to a dict.
-            as_json = output.export_json()
-            raw_output = json.loads(as_json)
+            # Export structured output in JSON mode to guarantee the value is
+            # serializable, without a round trip through a JSON string.
+            raw_output = output.export_dict(mode="json")
         else:
             raw_output = str(output)
 
-        cache.set_map_item(cache_key, "output", raw_output)
-        cache.set_map_item(cache_key, "timestamp", timestamp)
-        cache.expire(cache_key, expire_in=_state.params.cache.timeout)
+        with cache.pipeline() as pipeline:
+            pipeline.set_map_item(cache_key, "output", raw_output)
+            pipeline.set_map_item(cache_key, "timestamp", timestamp)
+            pipeline.expire(cache_key, expire_in=cache_timeout)
 
-        _log.bind(cache_timeout=_state.params.cache.timeout).debug("Response cached")
+        _log.bind(cache_timeout=cache_timeout).debug("Response cached")
 
         runtime = int(round(elapsedtime, 0))
+        response_body = raw_output
 
-    # If it does, return the cached entry
-    cache_response = cache.get_map(cache_key, "output")
-
-    json_output = is_type(cache_response, t.Dict)
-    response_format = "text/plain"
-
-    if json_output:
-        response_format = "application/json"
+    response_format = "application/json" if json_output else "text/plain"
     _log.info("Execution completed")
 
     response = {
-        "output": cache_response,
+        "output": response_body,
         "id": cache_key,
         "cached": cached,
         "runtime": runtime,
@@ -169,7 +171,7 @@ async def query(_state: HyperglassState, request: Request, data: Query) -> Query
         response,
         background=BackgroundTask(
             send_webhook,
-            params=_state.params,
+            params=params,
             data=data,
             request=request,
             timestamp=timestamp,
@@ -177,78 +179,42 @@ async def query(_state: HyperglassState, request: Request, data: Query) -> Query
     )
 
 
-# ALS Feature Integration - Speed Test Endpoints
-
-@get("/api/speedtest/download")
-async def speedtest_download(request: Request) -> Response:
-    """Handle speed test download endpoint."""
-    # Local
-    from .speedtest import handle_speedtest_download
-
-    return await handle_speedtest_download(request)
-
-
-@post("/api/speedtest/upload")
-async def speedtest_upload(request: Request) -> Response:
-    """Handle speed test upload endpoint."""
-    # Local
-    from .speedtest import handle_speedtest_upload
-
-    return await handle_speedtest_upload(request)
-
-
-@get("/api/speedtest/file/{filename:str}")
-async def speedtest_file(filename: str, request: Request) -> Response:
-    """Handle speed test file download endpoint."""
-    # Local
-    from .speedtest import handle_speedtest_file
-
-    return await handle_speedtest_file(filename, request)
-
-
-# ALS Feature Integration - Network Tools
-
-@get("/api/tools/iperf3/server")
-async def iperf3_server(request: Request) -> Response:
-    """Handle iperf3 server endpoint."""
-    # Local
-    from .network_tools import handle_iperf3_server
-
-    return await handle_iperf3_server(request)
-
-
-@get("/api/tools/ping")
-async def network_ping(request: Request) -> Response:
-    """Handle network ping endpoint."""
-    # Local
-    from .network_tools import handle_network_ping
-
-    return await handle_network_ping(request)
-
-
-@get("/api/tools/traceroute")
-async def network_traceroute(request: Request) -> Response:
-    """Handle network traceroute endpoint."""
-    # Local
-    from .network_tools import handle_traceroute
-
-    return await handle_traceroute(request)
-
-
-@get("/api/bandwidth/stats")
-async def bandwidth_stats(request: Request) -> Response:
-    """Handle bandwidth statistics endpoint."""
-    # Local
-    from .bandwidth import handle_bandwidth_stats
-
-    return await handle_bandwidth_stats(request)
+# ALS Feature Integration
+#
+# The ALS implementations declare their own parameters, so they are registered as route
+# handlers directly instead of through forwarding functions.
 
 
 @get("/api/als/status")
-async def als_status(request: Request) -> Response:
+async def als_status() -> Response:
     """Get ALS features status."""
-    # Local
-    from .als_startup import get_als_status
-
     status = get_als_status()
     return Response(content=status, media_type="application/json")
+
+
+# The network tool UI relies on the response status, so invalid tool parameters are
+# answered with a 400 rather than the app-wide validation error response.
+_PARAMETER_ERROR_HANDLERS = {ValidationException: parameter_validation_handler}
+
+ALS_HANDLERS = (
+    get("/api/speedtest/download", name="speedtest_download")(handle_speedtest_download),
+    post("/api/speedtest/upload", name="speedtest_upload")(handle_speedtest_upload),
+    get("/api/speedtest/file/{filename:str}", name="speedtest_file")(handle_speedtest_file),
+    get(
+        "/api/tools/iperf3/server",
+        name="iperf3_server",
+        exception_handlers=_PARAMETER_ERROR_HANDLERS,
+    )(handle_iperf3_server),
+    get(
+        "/api/tools/ping",
+        name="network_ping",
+        exception_handlers=_PARAMETER_ERROR_HANDLERS,
+    )(handle_network_ping),
+    get(
+        "/api/tools/traceroute",
+        name="network_traceroute",
+        exception_handlers=_PARAMETER_ERROR_HANDLERS,
+    )(handle_traceroute),
+    get("/api/bandwidth/stats", name="bandwidth_stats")(handle_bandwidth_stats),
+    als_status,
+)
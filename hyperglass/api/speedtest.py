@@ -3,18 +3,60 @@
 # Standard Library
 import os
 import time
-import asyncio
-import secrets
-from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+from functools import lru_cache
 
 # Third Party
 from litestar import Request, Response
+from litestar.response import Stream
 from litestar.exceptions import HTTPException
 
 # Project
 from hyperglass.log import log
 from hyperglass.state import use_state
+from hyperglass.models.config.als_features import FILE_SIZE_RE
+
+# Speed test payloads only need to be incompressible, not unpredictable, so a single
+# random buffer is generated once and reused for every download chunk.
+_SPEEDTEST_CHUNK = os.urandom(1 << 20)
+
+# Default download chunk size in KB. Large chunks amortize per-chunk overhead; pacing
+# comes from the transport's backpressure on each send.
+_DEFAULT_CHUNK_KB = 64
+
+# Shared zero-filled chunk for speed test file downloads.
+_ZERO_CHUNK = bytes(64 * 1024)
+
+_SIZE_UNITS = {"KB": 1024, "MB": 1024 * 1024, "GB": 1024 * 1024 * 1024}
+_MAX_FILE_BYTES = 10 * _SIZE_UNITS["GB"]
+
+# Map of downloadable file names (e.g. "100MB.bin") to their size in bytes, built from
+# the configured file sizes on first use.
+_FILE_SIZE_TABLE: Optional[Dict[str, int]] = None
+
+_NO_CACHE_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+
+def _file_size_table() -> Dict[str, int]:
+    """Get the table of downloadable speed test files, building it if needed."""
+    global _FILE_SIZE_TABLE
+    if _FILE_SIZE_TABLE is None:
+        table = {}
+        for size in get_speedtest_config()["file_sizes"]:
+            match = FILE_SIZE_RE.match(size)
+            if match is None:
+                continue
+            number, unit = match.groups()
+            total_bytes = int(number) * _SIZE_UNITS[unit]
+            if 0 < total_bytes <= _MAX_FILE_BYTES:
+                table[f"{size}.bin"] = total_bytes
+        _FILE_SIZE_TABLE = table
+    return _FILE_SIZE_TABLE
 
 
 async def handle_speedtest_download(request: Request) -> Response:
@@ -22,7 +64,6 @@ async def handle_speedtest_download(request: Request) -> Response:
     
     # Get query parameters
     size = request.query_params.get("size", "10")
-    chunk_size = int(request.query_params.get("ckSize", "4"))
     
     try:
         size_mb = int(size)
@@ -31,6 +72,13 @@ async def handle_speedtest_download(request: Request) -> Response:
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid size parameter")
     
+    try:
+        chunk_size = int(request.query_params.get("ckSize", _DEFAULT_CHUNK_KB))
+        if chunk_size <= 0:
+            raise ValueError("Invalid chunk size")
+    except ValueError as err:
+        raise HTTPException(status_code=400, detail="Invalid ckSize parameter") from err
+    
     # Calculate total bytes
     total_bytes = size_mb * 1024 * 1024
     chunk_bytes = chunk_size * 1024
@@ -39,25 +87,21 @@ async def handle_speedtest_download(request: Request) -> Response:
     
     async def generate_data():
         """Generate random data for download speed test."""
+        chunk = _SPEEDTEST_CHUNK[:chunk_bytes]
         bytes_sent = 0
         while bytes_sent < total_bytes:
-            remaining = min(chunk_bytes, total_bytes - bytes_sent)
-            # Generate random data
-            chunk = secrets.token_bytes(remaining)
+            remaining = total_bytes - bytes_sent
+            if remaining < len(chunk):
+                chunk = chunk[:remaining]
             bytes_sent += len(chunk)
             yield chunk
-            
-            # Small delay to prevent overwhelming the connection
-            await asyncio.sleep(0.001)
     
-    return Response(
-        content=generate_data(),
+    return Stream(
+        generate_data(),
         media_type="application/octet-stream",
         headers={
             "Content-Length": str(total_bytes),
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0",
+            **_NO_CACHE_HEADERS,
         }
     )
 
@@ -65,19 +109,15 @@ async def handle_speedtest_download(request: Request) -> Response:
 async def handle_speedtest_upload(request: Request) -> Response:
     """Handle speed test upload endpoint for measuring upload speed."""
     
-    start_time = time.time()
     total_bytes = 0
     
     try:
-        # Read the uploaded data
-        body = await request.body()
-        total_bytes = len(body)
+        # Count the uploaded data as it arrives rather than buffering the whole body.
+        start_ns = time.monotonic_ns()
+        async for chunk in request.stream():
+            total_bytes += len(chunk)
         
-        # Simulate processing time
-        await asyncio.sleep(0.1)
-        
-        end_time = time.time()
-        duration = end_time - start_time
+        duration = (time.monotonic_ns() - start_ns) / 1e9
         
         log.info(f"Speed test upload completed: {total_bytes} bytes in {duration:.2f}s")
         
@@ -98,61 +138,40 @@ async def handle_speedtest_upload(request: Request) -> Response:
 async def handle_speedtest_file(filename: str, request: Request) -> Response:
     """Handle speed test file download endpoint."""
     
-    # Parse filename to get size (e.g., "100MB.bin")
-    try:
-        if filename.endswith(".bin"):
-            size_str = filename[:-4]  # Remove .bin extension
-            
-            # Parse size (e.g., "100MB", "1GB")
-            if size_str.endswith("MB"):
-                size_mb = int(size_str[:-2])
-            elif size_str.endswith("GB"):
-                size_mb = int(size_str[:-2]) * 1024
-            else:
-                raise ValueError("Invalid file format")
-                
-            if size_mb <= 0 or size_mb > 10240:  # Limit to 10GB max
-                raise ValueError("File size too large")
-                
-        else:
-            raise ValueError("Invalid filename format")
-            
-    except ValueError:
+    # Only configured file sizes (e.g., "100MB.bin") can be downloaded.
+    total_bytes = _file_size_table().get(filename)
+    if total_bytes is None:
         raise HTTPException(status_code=404, detail="File not found")
     
-    total_bytes = size_mb * 1024 * 1024
-    chunk_size = 64 * 1024  # 64KB chunks
-    
-    log.info(f"Starting file download: {filename} ({size_mb}MB)")
+    log.info(f"Starting file download: {filename} ({total_bytes} bytes)")
     
     async def generate_file_data():
         """Generate file data for download."""
+        chunk_size = len(_ZERO_CHUNK)
         bytes_sent = 0
         while bytes_sent < total_bytes:
             remaining = min(chunk_size, total_bytes - bytes_sent)
-            # Generate zeros for faster generation
-            chunk = b'\x00' * remaining
-            bytes_sent += len(chunk)
-            yield chunk
-            
-            # Small delay to prevent overwhelming
-            await asyncio.sleep(0.001)
+            bytes_sent += remaining
+            yield _ZERO_CHUNK if remaining == chunk_size else _ZERO_CHUNK[:remaining]
     
-    return Response(
-        content=generate_file_data(),
+    return Stream(
+        generate_file_data(),
         media_type="application/octet-stream",
         headers={
             "Content-Length": str(total_bytes),
             "Content-Disposition": f"attachment; filename={filename}",
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0",
+            **_NO_CACHE_HEADERS,
         }
     )
 
 
-def get_speedtest_config() -> dict:
-    """Get speed test configuration."""
+@lru_cache(maxsize=1)
+def get_speedtest_config() -> Mapping[str, Any]:
+    """Get speed test configuration.
+    
+    The result is built once per configuration generation and is read-only, since it is
+    shared by all callers. Use `reset_speedtest_config` after the configuration changes.
+    """
     state = use_state()
     
     # Default configuration
@@ -164,8 +183,17 @@ def get_speedtest_config() -> dict:
     }
     
     # Override with user configuration if available
-    if hasattr(state.params, 'speedtest'):
-        user_config = state.params.speedtest
-        config.update(user_config)
+    als_features = getattr(state.params, 'als_features', None)
+    if als_features is not None:
+        config.update(als_features.speedtest.model_dump())
     
-    return config
+    # Freeze nested values too, so callers can't modify the shared file sizes.
+    config["file_sizes"] = tuple(config["file_sizes"])
+    return MappingProxyType(config)
+
+
+def reset_speedtest_config() -> None:
+    """Discard speed test configuration derived from a previous configuration."""
+    global _FILE_SIZE_TABLE
+    get_speedtest_config.cache_clear()
+    _FILE_SIZE_TABLE = None
@@ -46,6 +46,7 @@ class Query(BaseModel):
     # Directive `id` field
     query_type: str = Field(strict=True, min_length=1, strip_whitespace=True)
     _kwargs: t.Dict[str, t.Any]
+    _digest: t.Optional[str] = None
 
     def __init__(self, **data) -> None:
         """Initialize the query with a UTC timestamp at initialization time."""
@@ -89,8 +90,13 @@ class Query(BaseModel):
         return repr(self)
 
     def digest(self) -> str:
-        """Create SHA256 hash digest of model representation."""
-        return hashlib.sha256(repr(self).encode()).hexdigest()
+        """Create a BLAKE2b hash digest of model representation.
+
+        The digest is computed once; query fields are final after initialization.
+        """
+        if self._digest is None:
+            self._digest = hashlib.blake2b(repr(self).encode(), digest_size=16).hexdigest()
+        return self._digest
 
     def random(self) -> str:
         """Create a random string to prevent client or proxy caching."""
@@ -1,30 +1,41 @@
 """Configuration models for ALS features integration."""
 
 # Standard Library
+import re
 import typing as t
 from pathlib import Path
 
 # Third Party
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, model_validator
 
 # Project
 from ..main import HyperglassModel
 
+# Positive file size strings such as "100MB", captured as (number, unit).
+FILE_SIZE_RE = re.compile(r"^([1-9][0-9]*)(KB|MB|GB)$")
+
+FileSize = t.Annotated[str, Field(pattern=FILE_SIZE_RE.pattern)]
+
+# ALSFeatures fields that hold a feature configuration with its own `enabled` flag.
+ALS_FEATURE_NAMES = ("speedtest", "network_tools", "bandwidth")
+
 
 class SpeedTestConfig(HyperglassModel):
     """Speed test configuration."""
     
+    _file_size_set: t.FrozenSet[str] = PrivateAttr(frozenset())
+    
     enabled: bool = Field(
         default=True,
         description="Enable speed test features"
     )
     
-    file_sizes: t.List[str] = Field(
+    file_sizes: t.List[FileSize] = Field(
         default=["1MB", "10MB", "100MB", "1GB"],
         description="Available file sizes for download tests"
     )
     
-    max_file_size: str = Field(
+    max_file_size: FileSize = Field(
         default="1GB",
         description="Maximum file size for speed tests"
     )
@@ -46,18 +57,16 @@ class SpeedTestConfig(HyperglassModel):
         description="Enable download speed tests"
     )
     
-    @validator('file_sizes')
-    def validate_file_sizes(cls, v):
-        """Validate file sizes format."""
-        valid_units = ['KB', 'MB', 'GB']
-        for size in v:
-            if not any(size.endswith(unit) for unit in valid_units):
-                raise ValueError(f"Invalid file size format: {size}")
-            try:
-                int(size[:-2])
-            except ValueError:
-                raise ValueError(f"Invalid file size number: {size}")
-        return v
+    @model_validator(mode="after")
+    def index_file_sizes(self) -> "SpeedTestConfig":
+        """Index file sizes for constant-time membership checks."""
+        self._file_size_set = frozenset(self.file_sizes)
+        return self
+    
+    @property
+    def file_size_set(self) -> t.FrozenSet[str]:
+        """Get the available file sizes as a set."""
+        return self._file_size_set
 
 
 class NetworkToolsConfig(HyperglassModel):
@@ -83,9 +92,18 @@ class NetworkToolsConfig(HyperglassModel):
         description="Enable iperf3 server tool"
     )
     
-    iperf3_port_range: t.Tuple[int, int] = Field(
-        default=(30000, 31000),
-        description="Port range for iperf3 servers"
+    iperf3_port_start: int = Field(
+        default=30000,
+        description="First port of the range for iperf3 servers",
+        ge=1024,
+        le=65535
+    )
+    
+    iperf3_port_end: int = Field(
+        default=31000,
+        description="Last port of the range for iperf3 servers",
+        ge=1024,
+        le=65535
     )
     
     max_ping_count: int = Field(
@@ -116,15 +134,27 @@ class NetworkToolsConfig(HyperglassModel):
         le=300
     )
     
-    @validator('iperf3_port_range')
-    def validate_port_range(cls, v):
+    @model_validator(mode="before")
+    def split_port_range(cls: "NetworkToolsConfig", data: t.Any) -> t.Any:
+        """Accept the legacy `iperf3_port_range: [start, end]` form."""
+        if isinstance(data, dict) and "iperf3_port_range" in data:
+            data = dict(data)
+            port_range = data.pop("iperf3_port_range")
+            if not isinstance(port_range, (list, tuple)) or len(port_range) != 2:
+                raise ValueError("iperf3_port_range must be a list of [start, end] ports")
+            if {"iperf3_port_start", "iperf3_port_end"} & data.keys():
+                raise ValueError(
+                    "iperf3_port_range can't be combined with iperf3_port_start/iperf3_port_end"
+                )
+            data["iperf3_port_start"], data["iperf3_port_end"] = port_range
+        return data
+    
+    @model_validator(mode="after")
+    def validate_port_range(self) -> "NetworkToolsConfig":
         """Validate iperf3 port range."""
-        start, end = v
-        if start >= end:
+        if self.iperf3_port_start >= self.iperf3_port_end:
             raise ValueError("Start port must be less than end port")
-        if start < 1024 or end > 65535:
-            raise ValueError("Ports must be between 1024 and 65535")
-        return v
+        return self
 
 
 class BandwidthConfig(HyperglassModel):
@@ -188,8 +218,4 @@ class ALSFeatures(HyperglassModel):
         if not self.enabled:
             return False
         
-        feature_config = getattr(self, feature, None)
-        if feature_config and hasattr(feature_config, 'enabled'):
-            return feature_config.enabled
-        
-        return False
+        return feature in ALS_FEATURE_NAMES and getattr(self, feature).enabled
@@ -124,6 +124,25 @@ class RedisManager:
             return pickle.loads(value)  # noqa
         return None
 
+    def get_all_map(
+        self,
+        key: str,
+        *,
+        expire_in: t.Optional[t.Union[timedelta, int]] = None,
+    ) -> t.Dict[str, t.Any]:
+        """Get all items of a Redis hash map, optionally resetting the key's expiration.
+
+        Both commands are sent in a single transaction, so the values and the expiration
+        reset cost one round trip.
+        """
+        name = self.key(key)
+        pipeline = self.instance.pipeline(transaction=True)
+        pipeline.hgetall(name)
+        if isinstance(expire_in, (timedelta, int)):
+            pipeline.expire(name, expire_in)
+        value = pipeline.execute()[0]
+        return {k.decode(): pickle.loads(v) for k, v in value.items()}  # noqa
+
     def set_map_item(self, key: str, item: str, value: t.Any) -> None:
         """Add a value to a hash map (dict)."""
         name = self.key(key)
@@ -1,12 +1,28 @@
 """Tests for ALS features."""
 
 # Standard Library
+import os
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock
 
+# Third Party
+from pydantic import ValidationError
+from psutil._common import snetio
+
 # Project
-from hyperglass.models.config.als_features import ALSFeatures, SpeedTestConfig, NetworkToolsConfig, BandwidthConfig
-from hyperglass.util.als_config_validator import validate_als_config, check_system_requirements
+from hyperglass.models.config.als_features import (
+    ALSFeatures,
+    BandwidthConfig,
+    SpeedTestConfig,
+    NetworkToolsConfig,
+)
+from hyperglass.util.als_config_validator import (
+    validate_als_config,
+    generate_default_config,
+    reload_system_tool_cache,
+    check_system_requirements,
+)
 
 
 class TestALSConfiguration:
@@ -31,11 +47,24 @@ class TestALSConfiguration:
         )
         assert config.enabled is True
         assert "1MB" in config.file_sizes
+        assert config.file_size_set == {"1MB", "10MB", "100MB"}
+        
+        config.file_sizes = ["1GB"]
+        assert config.file_size_set == {"1GB"}
         
         # Invalid file size format
         with pytest.raises(ValueError):
             SpeedTestConfig(file_sizes=["1XB"])  # Invalid unit
         
+        with pytest.raises(ValueError):
+            SpeedTestConfig(file_sizes=["1.5MB"])  # Invalid number
+        
+        with pytest.raises(ValueError):
+            SpeedTestConfig(file_sizes=["0MB"])  # Not positive
+        
+        with pytest.raises(ValueError):
+            SpeedTestConfig(max_file_size="1TB")  # Invalid unit
+        
         # Invalid chunk size
         with pytest.raises(ValueError):
             SpeedTestConfig(chunk_size=0)  # Too small
@@ -48,19 +77,30 @@ class TestALSConfiguration:
         # Valid configuration
         config = NetworkToolsConfig(
             enabled=True,
-            iperf3_port_range=(30000, 31000),
+            iperf3_port_start=30000,
+            iperf3_port_end=31000,
             max_ping_count=10,
             max_traceroute_hops=30
         )
         assert config.enabled is True
-        assert config.iperf3_port_range == (30000, 31000)
+        assert (config.iperf3_port_start, config.iperf3_port_end) == (30000, 31000)
+        
+        # Legacy port range form
+        config = NetworkToolsConfig(iperf3_port_range=[30000, 30100])
+        assert (config.iperf3_port_start, config.iperf3_port_end) == (30000, 30100)
         
         # Invalid port range
         with pytest.raises(ValueError):
-            NetworkToolsConfig(iperf3_port_range=(31000, 30000))  # Start > End
+            NetworkToolsConfig(iperf3_port_start=31000, iperf3_port_end=30000)  # Start > End
         
         with pytest.raises(ValueError):
-            NetworkToolsConfig(iperf3_port_range=(100, 200))  # Ports too low
+            NetworkToolsConfig(iperf3_port_start=100, iperf3_port_end=200)  # Ports too low
+        
+        with pytest.raises(ValidationError):
+            NetworkToolsConfig(iperf3_port_range=30000)  # Not a [start, end] pair
+        
+        with pytest.raises(ValidationError):
+            NetworkToolsConfig(iperf3_port_range=[30000, 30100], iperf3_port_end=30200)
         
         # Invalid limits
         with pytest.raises(ValueError):
@@ -103,7 +143,8 @@ class TestALSConfiguration:
                 },
                 "network_tools": {
                     "enabled": True,
-                    "iperf3_port_range": [30000, 31000]
+                    "iperf3_port_start": 30000,
+                    "iperf3_port_end": 31000
                 },
                 "bandwidth": {
                     "enabled": True,
@@ -131,7 +172,34 @@ class TestALSConfiguration:
         
         is_valid, errors = validate_als_config(config_data)
         assert is_valid is False
-        assert len(errors) > 0
+        assert len(errors) == 2
+        assert errors[0].startswith("speedtest.file_sizes.0: ")
+        assert errors[1].startswith("speedtest.chunk_size: ")
+    
+    def test_validate_als_config_disabled(self):
+        """Test feature checks are skipped when ALS features are disabled."""
+        config_data = {"als_features": {"enabled": False}}
+        with patch(
+            'hyperglass.util.als_config_validator._validate_speedtest_config'
+        ) as mock_validate:
+            is_valid, errors = validate_als_config(config_data)
+        assert is_valid is True
+        assert errors == []
+        mock_validate.assert_not_called()
+    
+    def test_validate_als_config_model(self):
+        """Test validation of an already-parsed ALS configuration model."""
+        is_valid, errors = validate_als_config(ALSFeatures())
+        assert is_valid is True
+        assert len(errors) == 0
+    
+    def test_generate_default_config(self):
+        """Test default configuration copies are independent."""
+        config = generate_default_config()
+        assert config == ALSFeatures().model_dump()
+        
+        config['speedtest']['file_sizes'].append('5GB')
+        assert '5GB' not in generate_default_config()['speedtest']['file_sizes']
     
     def test_validate_als_config_empty(self):
         """Test validation with no ALS configuration."""
@@ -145,29 +213,55 @@ class TestALSConfiguration:
 class TestSystemRequirements:
     """Test system requirements checking."""
     
-    @patch('shutil.which')
-    def test_check_system_requirements_all_present(self, mock_which):
+    @pytest.fixture(autouse=True)
+    def clear_tool_cache(self):
+        """Resolve tools from each test's PATH."""
+        reload_system_tool_cache()
+        yield
+        reload_system_tool_cache()
+    
+    @pytest.fixture
+    def tool_dir(self, tmp_path, monkeypatch):
+        """Use an empty directory as the only PATH entry."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        return tmp_path
+    
+    @staticmethod
+    def add_tools(directory, *tools, mode=0o755):
+        """Create placeholder executables."""
+        for tool in tools:
+            (directory / tool).touch(mode=mode)
+    
+    def test_check_system_requirements_all_present(self, tool_dir):
         """Test when all required tools are present."""
-        mock_which.return_value = "/usr/bin/tool"
+        self.add_tools(tool_dir, 'ping', 'ping6', 'traceroute', 'traceroute6', 'iperf3')
         
         requirements_met, missing_tools = check_system_requirements()
         assert requirements_met is True
         assert len(missing_tools) == 0
     
-    @patch('shutil.which')
-    def test_check_system_requirements_missing_tools(self, mock_which):
+    def test_check_system_requirements_missing_tools(self, tool_dir):
         """Test when some tools are missing."""
-        def mock_which_side_effect(tool):
-            if tool in ['ping', 'traceroute']:
-                return "/usr/bin/" + tool
-            return None
-        
-        mock_which.side_effect = mock_which_side_effect
+        self.add_tools(tool_dir, 'ping', 'traceroute')
+        self.add_tools(tool_dir, 'iperf3', mode=0o644)  # Not executable
         
         requirements_met, missing_tools = check_system_requirements()
         assert requirements_met is False
-        assert len(missing_tools) > 0
-        assert any('iperf3' in tool for tool in missing_tools)
+        assert len(missing_tools) == 3
+        assert any(tool.startswith('iperf3: ') for tool in missing_tools)
+        assert not any(tool.startswith('ping: ') for tool in missing_tools)
+    
+    def test_check_system_requirements_cached(self, tool_dir):
+        """Test PATH is scanned once and cached until the cache is reloaded."""
+        with patch('os.listdir', wraps=os.listdir) as mock_listdir:
+            check_system_requirements()
+            assert mock_listdir.call_count == 1
+            check_system_requirements()
+            assert mock_listdir.call_count == 1
+            
+            reload_system_tool_cache()
+            check_system_requirements()
+            assert mock_listdir.call_count == 2
 
 
 class TestALSFeatureIntegration:
@@ -200,6 +294,16 @@ class TestALSFeatureIntegration:
         config.speedtest.enabled = False
         assert config.is_feature_enabled('speedtest') is False
         assert config.is_feature_enabled('network_tools') is True
+        
+        # Replace a feature configuration
+        config.speedtest = SpeedTestConfig(enabled=True)
+        assert config.is_feature_enabled('speedtest') is True
+        assert config.is_feature_enabled('unknown') is False
+        
+        # Copies & unvalidated construction see the current feature configurations
+        copied = config.model_copy(update={"speedtest": SpeedTestConfig(enabled=False)})
+        assert copied.is_feature_enabled('speedtest') is False
+        assert ALSFeatures.model_construct().is_feature_enabled('bandwidth') is True
     
     def test_feature_config_inheritance(self):
         """Test that feature configs inherit from main enabled setting."""
@@ -211,6 +315,117 @@ class TestALSFeatureIntegration:
         assert config.is_feature_enabled('bandwidth') is False
 
 
+class TestBandwidthMonitor:
+    """Test bandwidth monitor statistics collection."""
+
+    @staticmethod
+    def _counters(bytes_sent, bytes_recv, packets_sent, packets_recv):
+        return snetio(bytes_sent, bytes_recv, packets_sent, packets_recv, 0, 0, 0, 0)
+
+    @patch('hyperglass.api.bandwidth._USE_PROCFS', False)
+    @patch('hyperglass.api.bandwidth.time.time')
+    @patch('hyperglass.api.bandwidth.psutil.net_if_stats')
+    @patch('hyperglass.api.bandwidth.psutil.net_io_counters')
+    def test_collect_stats_rates(self, mock_counters, mock_if_stats, mock_time):
+        """Test rate calculation between two samples."""
+        from hyperglass.api.bandwidth import BandwidthMonitor
+
+        mock_if_stats.return_value = {'eth0': None, 'lo': None}
+        monitor = BandwidthMonitor()
+
+        async def collect(monotonic):
+            loop = asyncio.get_running_loop()
+            with patch.object(loop, 'time', return_value=monotonic):
+                await monitor._collect_stats()
+
+        mock_time.return_value = 100.0
+        mock_counters.return_value = {
+            'eth0': self._counters(1000, 2000, 10, 20),
+            'lo': self._counters(1, 1, 1, 1),
+        }
+        asyncio.run(collect(10.0))
+
+        # Wall clock stepped backwards; rates follow the monotonic clock.
+        mock_time.return_value = 90.0
+        mock_counters.return_value = {'eth0': self._counters(3000, 6000, 14, 28)}
+        asyncio.run(collect(12.0))
+
+        stats = monitor.get_current_stats()
+        assert 'lo' not in stats
+        current = stats['eth0']['current']
+        assert current['send_rate'] == 1000
+        assert current['recv_rate'] == 2000
+        assert current['send_packets_rate'] == 2
+        assert current['recv_packets_rate'] == 4
+        assert current['total_sent'] == 3000
+        assert current['timestamp'] == 90.0
+
+        history = stats['eth0']['history']
+        assert len(history) == 2
+        assert history[0]['send_rate'] == 0
+        assert history[1]['bytes_recv'] == 6000
+
+    def test_history_follows_interval(self):
+        """Test current statistics include 30 seconds of history at any interval."""
+        from hyperglass.api.bandwidth import BandwidthMonitor
+
+        monitor = BandwidthMonitor(interval=5)
+        for second in range(0, 100, 5):
+            monitor.interface_stats['eth0'].append(float(second), float(second), 0, 0, 0, 0)
+
+        history = monitor.get_current_stats()['eth0']['history']
+        assert [sample['timestamp'] for sample in history] == [70.0, 75.0, 80.0, 85.0, 90.0, 95.0]
+
+    @patch('hyperglass.api.bandwidth.psutil.net_if_stats')
+    @patch('hyperglass.api.bandwidth.psutil.net_if_addrs')
+    def test_interface_info_cached(self, mock_if_addrs, mock_if_stats):
+        """Test interface info is reused within its TTL."""
+        from hyperglass.api.bandwidth import BandwidthMonitor
+
+        mock_if_addrs.return_value = {'eth0': []}
+        mock_if_stats.return_value = {}
+        monitor = BandwidthMonitor()
+
+        info = monitor.get_interface_info()
+        assert monitor.get_interface_info() is info
+        assert mock_if_addrs.call_count == 1
+
+    def test_ring_wraps(self):
+        """Test sample history keeps only the most recent samples."""
+        from hyperglass.api.bandwidth import _Ring
+
+        ring = _Ring(capacity=3)
+        for second in range(5):
+            ring.append(float(second), float(second), second * 100, 0, 0, 0)
+
+        assert len(ring) == 3
+        assert [sample.timestamp for sample in ring.tail(30)] == [2.0, 3.0, 4.0]
+        assert ring.latest().bytes_sent == 400
+        assert ring.latest().send_rate == 100
+
+    @patch('hyperglass.api.bandwidth.psutil.net_if_stats')
+    def test_read_proc_net_dev(self, mock_if_stats, tmp_path):
+        """Test parsing interface counters from /proc/net/dev."""
+        from hyperglass.api.bandwidth import BandwidthMonitor
+
+        proc_net_dev = tmp_path / "dev"
+        proc_net_dev.write_text(
+            "Inter-|   Receive                            |  Transmit\n"
+            " face |bytes packets errs drop fifo frame compressed multicast|bytes packets\n"
+            "    lo: 500 5 0 0 0 0 0 0 500 5 0 0 0 0 0 0\n"
+            "  eth0: 2000 20 0 0 0 0 0 0 1000 10 0 0 0 0 0 0\n"
+        )
+        mock_if_stats.return_value = {'eth0': None, 'lo': None}
+        monitor = BandwidthMonitor()
+        monitor._discover_interfaces()
+
+        with patch('hyperglass.api.bandwidth._PROC_NET_DEV', str(proc_net_dev)):
+            counters = list(monitor._read_proc_net_dev())
+        monitor._proc_net_dev.close()
+
+        assert counters == [('eth0', 1000, 2000, 10, 20)]
+
+
 class TestALSAPIEndpoints:
     """Test ALS API endpoints."""
 
@@ -231,17 +446,186 @@ class TestALSAPIEndpoints:
         assert 'features' in status
         assert 'status' in status
 
-    @patch('hyperglass.api.speedtest.secrets.token_bytes')
-    def test_speedtest_download_endpoint(self, mock_token_bytes, mock_request):
+    def test_als_status_cached(self):
+        """Test ALS status is reused until runtime state changes."""
+        from hyperglass.api.als_startup import get_als_status, invalidate_als_status
+        from hyperglass.api.bandwidth import bandwidth_monitor
+
+        invalidate_als_status()
+        status = get_als_status()
+        with patch('hyperglass.api.als_startup._build_als_status') as mock_build:
+            assert get_als_status() == status
+            mock_build.assert_not_called()
+
+            # Callers get their own copy of the cached status
+            status['features']['speedtest']['enabled'] = None
+            assert get_als_status()['features']['speedtest']['enabled'] is not None
+
+            with patch.object(bandwidth_monitor, 'monitoring', not bandwidth_monitor.monitoring):
+                get_als_status()
+            mock_build.assert_called_once()
+
+        invalidate_als_status()
+
+    @pytest.mark.parametrize(
+        "target,valid",
+        [
+            ("192.0.2.1", True),
+            ("2001:db8::1", True),
+            ("router-1.example.com", True),
+            ("-f", False),
+            ("---...", False),
+            ("example..com", False),
+            ("host;reboot", False),
+        ],
+    )
+    def test_network_tools_target_validation(self, target, valid):
+        """Test ping/traceroute target validation."""
+        from hyperglass.api.network_tools import _valid_target
+
+        assert _valid_target(target) is valid
+
+    def test_iperf3_configured_port_range(self):
+        """Test iperf3 servers use the configured port range."""
+        from hyperglass.api import network_tools
+
+        state = MagicMock()
+        state.params.als_features = ALSFeatures(
+            network_tools=NetworkToolsConfig(iperf3_port_start=40000, iperf3_port_end=40010)
+        )
+        with patch.object(network_tools, 'use_state', return_value=state):
+            manager = network_tools.IPerf3Server()
+            assert manager.get_port_range() == (40000, 40010)
+            assert 40000 <= manager.get_available_port() <= 40010
+
+    def test_iperf3_exited_server_not_signalled(self):
+        """Test stopping an iperf3 server that already exited sends no signal."""
+        from hyperglass.api.network_tools import IPerf3Server
+
+        async def wait():
+            # Simulate the entry being pruned while the stop is waiting.
+            manager.processes.clear()
+            return 0
+
+        manager = IPerf3Server()
+        manager.processes = {30000: MagicMock(returncode=0, wait=wait)}
+        with patch('os.killpg') as mock_killpg:
+            assert asyncio.run(manager.stop_server(30000)) is True
+        mock_killpg.assert_not_called()
+        assert manager.processes == {}
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/api/tools/ping",
+            "/api/tools/ping?target=192.0.2.1&count=50",
+            "/api/tools/traceroute?target=192.0.2.1&max_hops=0",
+            "/api/tools/iperf3/server?action=stop&port=abc",
+        ],
+    )
+    def test_network_tools_invalid_parameters(self, url):
+        """Test invalid network tool parameters get a client error status."""
+        from litestar.testing import create_test_client
+        from litestar.exceptions import ValidationException
+        from hyperglass.api.routes import ALS_HANDLERS
+        from hyperglass.api.error_handlers import validation_handler
+
+        with create_test_client(
+            route_handlers=list(ALS_HANDLERS),
+            exception_handlers={ValidationException: validation_handler},
+        ) as client:
+            response = client.get(url)
+
+        assert response.status_code == 400
+        assert response.json()['status_code'] == 400
+
+    def test_iperf3_exited_servers_release_ports(self):
+        """Test ports held by iperf3 servers that have exited are reused."""
+        from hyperglass.api.network_tools import IPerf3Server
+
+        manager = IPerf3Server()
+        manager.port_range = (30000, 30001)
+        manager.processes = {30000: MagicMock(returncode=0), 30001: MagicMock(returncode=None)}
+
+        assert manager.get_available_port() == 30000
+        assert list(manager.processes) == [30001]
+
+    def test_speedtest_download_endpoint(self, mock_request):
         """Test speed test download endpoint."""
         from hyperglass.api.speedtest import handle_speedtest_download
 
-        mock_token_bytes.return_value = b'test_data'
         mock_request.query_params = {'size': '1', 'ckSize': '4'}
 
-        # This would normally return a Response object
-        # In a real test, we'd use a test client
-        pass
+        async def download():
+            response = await handle_speedtest_download(mock_request)
+            return [chunk async for chunk in response.iterator]
+
+        chunks = asyncio.run(download())
+        assert sum(len(chunk) for chunk in chunks) == 1024 * 1024
+        assert {len(chunk) for chunk in chunks} == {4 * 1024}
+
+    def test_speedtest_upload_endpoint(self, mock_request):
+        """Test speed test upload endpoint counts streamed bytes."""
+        from hyperglass.api.speedtest import handle_speedtest_upload
+
+        async def stream():
+            for chunk in (b'a' * 1024, b'b' * 512):
+                yield chunk
+
+        mock_request.stream = stream
+        response = asyncio.run(handle_speedtest_upload(mock_request))
+        assert response.content['bytes_received'] == 1536
+
+    def test_speedtest_file_endpoint(self, mock_request):
+        """Test speed test file endpoint only serves configured sizes."""
+        from litestar.exceptions import HTTPException
+        from hyperglass.api.speedtest import handle_speedtest_file
+
+        response = asyncio.run(handle_speedtest_file('10MB.bin', mock_request))
+        assert response.headers['Content-Length'] == str(10 * 1024 * 1024)
+
+        for filename in ('5MB.bin', '10MB', 'invalid.bin'):
+            with pytest.raises(HTTPException):
+                asyncio.run(handle_speedtest_file(filename, mock_request))
+
+    @pytest.fixture
+    def custom_speedtest(self):
+        """Configure non-default speed test file sizes."""
+        from hyperglass.api import speedtest
+
+        state = MagicMock()
+        state.params.als_features = ALSFeatures(
+            speedtest=SpeedTestConfig(file_sizes=['5MB', '20MB'], max_file_size='20MB')
+        )
+        with patch.object(speedtest, 'use_state', return_value=state):
+            speedtest.reset_speedtest_config()
+            yield speedtest
+        speedtest.reset_speedtest_config()
+
+    def test_speedtest_configured_file_sizes(self, mock_request, custom_speedtest):
+        """Test speed test files follow the configured file sizes."""
+        from litestar.exceptions import HTTPException
+
+        assert custom_speedtest.get_speedtest_config()['file_sizes'] == ('5MB', '20MB')
+
+        response = asyncio.run(custom_speedtest.handle_speedtest_file('5MB.bin', mock_request))
+        assert response.headers['Content-Length'] == str(5 * 1024 * 1024)
+        with pytest.raises(HTTPException):
+            asyncio.run(custom_speedtest.handle_speedtest_file('1GB.bin', mock_request))
+
+    def test_speedtest_config_cached(self):
+        """Test speed test configuration is built once and read-only."""
+        from hyperglass.api.speedtest import get_speedtest_config, reset_speedtest_config
+
+        reset_speedtest_config()
+        config = get_speedtest_config()
+        assert get_speedtest_config() is config
+        with pytest.raises(TypeError):
+            config['enabled'] = False
+        assert isinstance(config['file_sizes'], tuple)
+
+        reset_speedtest_config()
+        assert get_speedtest_config() is not config
 
     def test_bandwidth_config_validation(self):
         """Test bandwidth configuration validation."""
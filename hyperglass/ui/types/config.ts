@@ -153,7 +153,8 @@ interface _ALSNetworkTools {
   ping_enabled: boolean;
   traceroute_enabled: boolean;
   iperf3_enabled: boolean;
-  iperf3_port_range: [number, number];
+  iperf3_port_start: number;
+  iperf3_port_end: number;
   max_ping_count: number;
   max_traceroute_hops: number;
   ping_timeout: number;
@@ -1,136 +1,127 @@
 """ALS Features Configuration Validator."""
 
 # Standard Library
+import os
+import copy
 import typing as t
+import functools
 from pathlib import Path
 
+# Third Party
+from pydantic import ValidationError
+
 # Project
 from hyperglass.log import log
 from hyperglass.models.config.als_features import ALSFeatures
 
+ConfigData = t.Union[ALSFeatures, t.Dict[str, t.Any]]
+
 
-def validate_als_config(config_data: t.Dict[str, t.Any]) -> t.Tuple[bool, t.List[str]]:
+def validate_als_config(config_data: ConfigData) -> t.Tuple[bool, t.List[str]]:
     """
     Validate ALS features configuration.
     
+    Value ranges & formats are enforced by the models themselves, so only checks the
+    models can't express remain here.
+    
     Args:
-        config_data: Configuration dictionary
+        config_data: Parsed ALS features model, or configuration dictionary
+            containing an 'als_features' section
         
     Returns:
         Tuple of (is_valid, error_messages)
     """
-    errors = []
-    
     try:
-        # Extract ALS configuration
-        als_config = config_data.get('als_features', {})
+        if isinstance(config_data, ALSFeatures):
+            # Already parsed, no need to round-trip through a dictionary.
+            als_features = config_data
+        else:
+            # Extract ALS configuration
+            als_config = config_data.get('als_features', {})
+            
+            if not als_config:
+                log.info("No ALS features configuration found, using defaults")
+                return True, []
+            
+            # Validate using Pydantic model
+            als_features = ALSFeatures.model_validate(als_config)
         
-        if not als_config:
-            log.info("No ALS features configuration found, using defaults")
+        if not als_features.enabled:
+            log.info("ALS features are disabled, skipping additional checks")
             return True, []
         
-        # Validate using Pydantic model
-        als_features = ALSFeatures(**als_config)
-        
-        # Additional validation checks
-        errors.extend(_validate_speedtest_config(als_features.speedtest))
-        errors.extend(_validate_network_tools_config(als_features.network_tools))
-        errors.extend(_validate_bandwidth_config(als_features.bandwidth))
-        
-        if errors:
-            return False, errors
+        # Additional checks, which only warn
+        _validate_speedtest_config(als_features.speedtest)
         
         log.info("ALS features configuration is valid")
         return True, []
         
+    except ValidationError as err:
+        return False, [_format_validation_error(error) for error in err.errors()]
+        
     except Exception as e:
-        errors.append(f"ALS configuration validation error: {e}")
-        return False, errors
+        return False, [f"ALS configuration validation error: {e}"]
 
 
-def _validate_speedtest_config(config) -> t.List[str]:
-    """Validate speed test configuration."""
-    errors = []
-    
+def _format_validation_error(error: t.Dict[str, t.Any]) -> str:
+    """Format a single pydantic validation error as `location: message`."""
+    location = ".".join(str(loc) for loc in error["loc"])
+    if location:
+        return f"{location}: {error['msg']}"
+    return error["msg"]
+
+
+def _validate_speedtest_config(config) -> None:
+    """Warn about speed test configuration that is valid but likely unintended."""
     if not config.enabled:
-        return errors
-    
-    # Validate file sizes
-    valid_units = ['KB', 'MB', 'GB']
-    for size in config.file_sizes:
-        if not any(size.endswith(unit) for unit in valid_units):
-            errors.append(f"Invalid file size format: {size}")
-            continue
-        
-        try:
-            size_num = int(size[:-2])
-            if size_num <= 0:
-                errors.append(f"File size must be positive: {size}")
-        except ValueError:
-            errors.append(f"Invalid file size number: {size}")
+        return
     
     # Validate max file size
-    if config.max_file_size not in config.file_sizes:
+    if config.max_file_size not in config.file_size_set:
         log.warning(f"Max file size {config.max_file_size} not in available sizes")
-    
-    # Validate chunk size
-    if config.chunk_size < 1 or config.chunk_size > 1024:
-        errors.append("Chunk size must be between 1 and 1024 KB")
-    
-    return errors
 
 
-def _validate_network_tools_config(config) -> t.List[str]:
-    """Validate network tools configuration."""
-    errors = []
-    
-    if not config.enabled:
-        return errors
-    
-    # Validate port range
-    start_port, end_port = config.iperf3_port_range
-    if start_port >= end_port:
-        errors.append("iPerf3 start port must be less than end port")
-    
-    if start_port < 1024 or end_port > 65535:
-        errors.append("iPerf3 ports must be between 1024 and 65535")
-    
-    # Validate limits
-    if config.max_ping_count < 1 or config.max_ping_count > 100:
-        errors.append("Max ping count must be between 1 and 100")
-    
-    if config.max_traceroute_hops < 1 or config.max_traceroute_hops > 255:
-        errors.append("Max traceroute hops must be between 1 and 255")
-    
-    # Validate timeouts
-    if config.ping_timeout < 5 or config.ping_timeout > 120:
-        errors.append("Ping timeout must be between 5 and 120 seconds")
-    
-    if config.traceroute_timeout < 10 or config.traceroute_timeout > 300:
-        errors.append("Traceroute timeout must be between 10 and 300 seconds")
+@functools.cache
+def _which_batch(names: t.Tuple[str, ...]) -> t.Dict[str, t.Optional[str]]:
+    """Locate several executables on PATH, reading each PATH directory once.
+
+    Results are cached until `reload_system_tool_cache` is called.
+    """
+    found: t.Dict[str, t.Optional[str]] = dict.fromkeys(names)
+    windows = os.name == "nt"
+    if windows:
+        extensions = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").lower().split(os.pathsep)
+    else:
+        extensions = [""]
+    
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        pending = [name for name, path in found.items() if path is None]
+        if not pending:
+            break
+        if not directory:
+            continue
+        try:
+            entries = os.listdir(directory)
+        except OSError:
+            continue
+        # Windows file names are case-insensitive.
+        entries = {entry.lower() if windows else entry for entry in entries}
+        
+        for name in pending:
+            for candidate in (name + extension for extension in extensions):
+                if (candidate.lower() if windows else candidate) not in entries:
+                    continue
+                path = os.path.join(directory, candidate)
+                if os.access(path, os.X_OK) and not os.path.isdir(path):
+                    found[name] = path
+                    break
     
-    return errors
+    return found
 
 
-def _validate_bandwidth_config(config) -> t.List[str]:
-    """Validate bandwidth monitoring configuration."""
-    errors = []
-    
-    if not config.enabled:
-        return errors
-    
-    # Validate intervals
-    if config.update_interval < 1 or config.update_interval > 60:
-        errors.append("Update interval must be between 1 and 60 seconds")
-    
-    if config.history_length < 10 or config.history_length > 3600:
-        errors.append("History length must be between 10 and 3600 seconds")
-    
-    # Validate excluded interfaces
-    if not isinstance(config.excluded_interfaces, list):
-        errors.append("Excluded interfaces must be a list")
-    
-    return errors
+def reload_system_tool_cache() -> None:
+    """Forget cached executable locations, e.g. after PATH or installed tools change."""
+    _which_batch.cache_clear()
 
 
 def check_system_requirements() -> t.Tuple[bool, t.List[str]]:
@@ -140,7 +131,7 @@ def check_system_requirements() -> t.Tuple[bool, t.List[str]]:
     Returns:
         Tuple of (requirements_met, missing_tools)
     """
-    missing_tools = []
+    missing_tools: t.List[t.Tuple[str, str]] = []
     
     # Check for required system tools
     required_tools = {
@@ -151,24 +142,29 @@ def check_system_requirements() -> t.Tuple[bool, t.List[str]]:
         'iperf3': 'iperf3 command for bandwidth testing',
     }
     
-    import shutil
-    
+    found = _which_batch(tuple(required_tools))
     for tool, description in required_tools.items():
-        if not shutil.which(tool):
-            missing_tools.append(f"{tool}: {description}")
+        if not found[tool]:
+            missing_tools.append((tool, description))
     
     if missing_tools:
-        log.warning(f"Missing system tools: {', '.join([t.split(':')[0] for t in missing_tools])}")
-        return False, missing_tools
+        log.warning("Missing system tools: {}", ", ".join(tool for tool, _ in missing_tools))
+        return False, [f"{tool}: {description}" for tool, description in missing_tools]
     
     log.info("All required system tools are available")
     return True, []
 
 
+@functools.cache
+def _default_config() -> t.Dict[str, t.Any]:
+    """Build the default ALS features configuration once."""
+    return ALSFeatures().model_dump()
+
+
 def generate_default_config() -> t.Dict[str, t.Any]:
     """Generate default ALS features configuration."""
-    default_config = ALSFeatures()
-    return default_config.model_dump()
+    # Callers may modify the result, so hand out a copy of the cached dump.
+    return copy.deepcopy(_default_config())
 
 
 def print_config_help():
@@ -197,7 +193,8 @@ Network Tools Configuration (als_features.network_tools):
   ping_enabled: Enable ping tool
   traceroute_enabled: Enable traceroute tool
   iperf3_enabled: Enable iperf3 server
-  iperf3_port_range: Port range for iperf3 servers [start, end]
+  iperf3_port_start: First port of the range for iperf3 servers
+  iperf3_port_end: Last port of the range for iperf3 servers
   max_ping_count: Maximum ping packets (1-100)
   max_traceroute_hops: Maximum traceroute hops (1-255)
   ping_timeout: Ping command timeout in seconds